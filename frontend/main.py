@@ -21,6 +21,7 @@ from services.services import UserService
 from ui.login_window import LoginWindow
 from ui.register_window import RegisterWindow
 from ui.dashboard import Dashboard
+from ui.styles import QSS
 
 
 class UserApp:
@@ -54,6 +55,7 @@ class UserApp:
         sets up all UI windows, and connects signal handlers for window transitions.
         """
         self.app = QApplication(sys.argv)
+        self.app.setStyleSheet(QSS)  # Parse the application stylesheet once
         self.user_service = UserService()
         self.current_user = None
         
@@ -71,12 +73,20 @@ class UserApp:
     
     def run(self):
         """
-        Start the application and show the initial login window.
-        
+        Start the application, restoring a cached session when possible.
+
+        If a previous login left a valid token in the local session cache,
+        the dashboard opens directly and no credentials are required;
+        otherwise the login window is shown.
+
         Returns:
             int: Application exit code from PyQt6 event loop
         """
-        self.show_login()
+        restored = self.user_service.restore_session()
+        if restored.get('success'):
+            self.on_login_success(restored['user'])
+        else:
+            self.show_login()
         return self.app.exec()
     
     def show_login(self):
@@ -27,6 +27,15 @@ class UserRole(Enum):
     STAFF = "staff"
 
 
+# Human-readable label for each role, computed once at import time so UI
+# code can look labels up instead of re-running role.value.title()
+ROLE_LABEL = {role: role.value.title() for role in UserRole}
+
+# Reverse lookup from API role string to enum member; a dict hit is
+# cheaper than the linear member scan inside UserRole(value)
+_ROLE_MAP = {role.value: role for role in UserRole}
+
+
 @dataclass
 class User:
     """
@@ -89,7 +98,7 @@ class User:
             id=data.get('id'),
             username=data.get('username', ''),
             email=data.get('email', ''),
-            role=UserRole(data.get('role', 'student')),
+            role=_ROLE_MAP[data.get('role', 'student')],
             is_active=data.get('is_active', True),
             first_name=data.get('first_name'),
             last_name=data.get('last_name')
@@ -26,6 +26,7 @@ import time
 import os
 from typing import List, Optional, Dict, Any
 from models.user import User, UserRole
+from utils.session_cache import save_session, load_session, clear_session
 
 # Load environment variables for frontend configuration
 try:
@@ -338,7 +339,10 @@ class UserService:
             
             # Create user object from API response
             self.current_user = User.from_api_data(user_data)
-            
+
+            # Cache the token so the next launch can skip re-auth
+            save_session(email, token)
+
             logger.info(f"Login successful for user: {self.current_user.username}")
             return {
                 'success': True,
@@ -353,6 +357,44 @@ class UserService:
             'error': response['error'].get('detail', 'Login failed')
         }
     
+    def restore_session(self) -> Dict[str, Any]:
+        """
+        Attempt to restore the previous session from the local cache.
+
+        If a token was cached by an earlier login, set it and validate it
+        against the profile endpoint. A stale or rejected token clears the
+        cache so the next launch falls back to the login window.
+
+        Returns:
+            Dict[str, Any]: Result with the restored User object or error
+        """
+        cached = load_session()
+        if not cached:
+            return {
+                'success': False,
+                'error': 'No cached session'
+            }
+
+        logger.info("Attempting to restore cached session")
+        self.api.set_auth_token(cached['token'])
+
+        result = self.get_current_user_profile()
+        if result['success']:
+            logger.info(f"Session restored for user: {self.current_user.username}")
+            return {
+                'success': True,
+                'user': self.current_user
+            }
+
+        # Token is stale or revoked - drop it and require a fresh login
+        logger.info("Cached session is no longer valid")
+        self.api.clear_auth_token()
+        clear_session()
+        return {
+            'success': False,
+            'error': 'Cached session expired'
+        }
+
     def logout(self) -> Dict[str, Any]:
         """
         Logout current user and invalidate authentication token.
@@ -369,7 +411,8 @@ class UserService:
             response = self.api.make_request('POST', 'auth/logout/')
             self.api.clear_auth_token()
             self.current_user = None
-            
+            clear_session()
+
             logger.info("Logout successful")
             return {
                 'success': True,
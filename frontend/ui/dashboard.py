@@ -1,130 +1,200 @@
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-                             QTableWidget, QTableWidgetItem, QComboBox, QMessageBox, 
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                             QTableView, QComboBox, QMessageBox,
                              QHeaderView, QAbstractItemView, QDialog, QDialogButtonBox)
-from PyQt6.QtCore import Qt, pyqtSignal
-from models.user import UserRole
+from PyQt6.QtCore import (Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QTimer,
+                          QSortFilterProxyModel)
+from PyQt6.QtGui import QBrush
+from models.user import UserRole, ROLE_LABEL
+from ui.widgets import populate_role_combo
+
+# Roles with access to the admin controls, resolved once at import time
+_ADMIN_ROLES = frozenset({UserRole.ADMIN, UserRole.FACULTY})
+
+
+class UsersTableModel(QAbstractTableModel):
+    """
+    Table model exposing the user list to the users table view.
+
+    Display strings (including the title-cased role label and status text)
+    are computed once in set_users(); data() only does tuple lookups, and
+    Qt requests data for visible rows only.
+    """
+
+    HEADERS = ['ID', 'Username', 'Email', 'Role', 'Status']
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._users = []
+        self._rows = []
+        # Shared status backgrounds, constructed once and reused by data()
+        self._bg_active = QBrush(Qt.GlobalColor.lightGray)
+        self._bg_inactive = QBrush(Qt.GlobalColor.yellow)
+
+    def set_users(self, users, current_user_id):
+        """Replace the model contents with a new list of users"""
+        self.beginResetModel()
+        self._users = users
+        rows = []
+        for user in users:
+            status_text = 'Active' if user.is_active else 'Inactive'
+            if user.id == current_user_id:
+                status_text += ' (You)'
+            rows.append((str(user.id), user.username, user.email,
+                         ROLE_LABEL[user.role], status_text))
+        self._rows = rows
+        self.endResetModel()
+
+    def user_at(self, row):
+        """Get the User object for a given row, or None if out of range"""
+        if 0 <= row < len(self._users):
+            return self._users[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+
+        if role == Qt.ItemDataRole.BackgroundRole and index.column() == 4:
+            user = self._users[index.row()]
+            return self._bg_active if user.is_active else self._bg_inactive
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
 
 class Dashboard(QWidget):
     logout_requested = pyqtSignal()
-    
+
     def __init__(self, user_service, current_user):
         super().__init__()
         self.user_service = user_service
         self.current_user = current_user
+
+        # Role cannot change within a session, so resolve these once
+        self._is_privileged = current_user.role in _ADMIN_ROLES
+        self._role_label = ROLE_LABEL[current_user.role]
+
+        # Debounce timer for the role filter: rapid combobox changes
+        # (e.g. keyboard navigation) coalesce into a single table reload
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(120)
+        self._filter_timer.timeout.connect(self.apply_role_filter)
+
+        # Role-change dialog is built lazily on first use and reused
+        self._role_dialog = None
+        self._role_dialog_combo = None
+
         self.init_ui()
-    
+
     def init_ui(self):
-        self.setWindowTitle(f'User Dashboard - {self.current_user.role.value.title()}')
+        self.setWindowTitle(f'User Dashboard - {self._role_label}')
         self.setGeometry(300, 300, 800, 500)
-        
+
+        # Admin buttons are only created for privileged roles below;
+        # explicit None lets later code use cheap `is not None` checks
+        self.toggle_status_button = None
+        self.change_role_button = None
+
         layout = QVBoxLayout()
-        
+
         # Header
         header_layout = QHBoxLayout()
-        
-        welcome_label = QLabel(f'Welcome, {self.current_user.username}! ({self.current_user.role.value.title()})')
-        welcome_label.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                font-weight: bold;
-                color: #2c3e50;
-                padding: 10px;
-            }
-        """)
-        
+
+        welcome_label = QLabel(f'Welcome, {self.current_user.username}! ({self._role_label})')
+        welcome_label.setObjectName('welcomeLabel')
+
         logout_button = QPushButton('Logout')
-        logout_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                padding: 8px 16px;
-                font-size: 12px;
-                border: none;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-        """)
+        logout_button.setObjectName('dangerButton')
         logout_button.clicked.connect(self.logout_requested.emit)
-        
+
         header_layout.addWidget(welcome_label)
         header_layout.addStretch()
         header_layout.addWidget(logout_button)
-        
+
         # User info
         info_label = QLabel('User Information')
-        info_label.setStyleSheet("font-size: 14px; font-weight: bold; padding: 10px;")
-        
+        info_label.setObjectName('sectionLabel')
+
         user_details = QLabel(f"""Username: {self.current_user.username}
 Email: {self.current_user.email}
-Role: {self.current_user.role.value.title()}
+Role: {self._role_label}
 Status: {'Active' if self.current_user.is_active else 'Inactive'}""")
-        user_details.setStyleSheet("padding: 10px; background-color: #808080; border-radius: 5px;")
-        
+        user_details.setObjectName('userDetails')
+
         # Role filter for users table
         filter_layout = QHBoxLayout()
         filter_label = QLabel('Filter by Role:')
-        filter_label.setStyleSheet("font-weight: bold; color: #2c3e50;")
-        
+        filter_label.setObjectName('fieldLabel')
+
         self.role_filter = QComboBox()
         self.load_filter_roles()  # Load roles based on user permissions
-        self.role_filter.currentIndexChanged.connect(self.load_users_table)
-        
+        # start() restarts the countdown, so bursts of changes fire one
+        # reload. The lambda drops the combo index — passing it through
+        # would hit the start(int) overload and replace the interval.
+        self.role_filter.currentIndexChanged.connect(
+            lambda: self._filter_timer.start()
+        )
+
         filter_layout.addWidget(filter_label)
         filter_layout.addWidget(self.role_filter)
         filter_layout.addStretch()
-        
+
         # Users table
         table_label = QLabel('All Users')
-        table_label.setStyleSheet("font-size: 14px; font-weight: bold; padding: 10px;")
-        
-        self.users_table = QTableWidget()
+        table_label.setObjectName('sectionLabel')
+
+        self.users_table = QTableView()
+        self.users_model = UsersTableModel(self)
+        # Role filtering runs in the proxy (C++ side) over the existing
+        # model instead of rebuilding the Python user list per filter change
+        self.users_proxy = QSortFilterProxyModel(self)
+        self.users_proxy.setSourceModel(self.users_model)
+        self.users_proxy.setFilterKeyColumn(3)
+        self.users_table.setModel(self.users_proxy)
         self.setup_users_table()
         self.load_users_table()
-        
+
         # Admin controls (show based on user role permissions)
-        if self.should_show_admin_controls():
+        show_admin = self.should_show_admin_controls()
+        if show_admin:
             admin_controls_layout = QHBoxLayout()
-            
+
             # Only show toggle status for admin and faculty
-            if self.current_user.role in [UserRole.ADMIN, UserRole.FACULTY]:
+            if self._is_privileged:
                 self.toggle_status_button = QPushButton('Toggle Status')
+                self.toggle_status_button.setObjectName('adminButton')
                 self.toggle_status_button.clicked.connect(self.toggle_selected_user_status)
-            
+
             # Only show change role for admin
             if self.current_user.role == UserRole.ADMIN:
                 self.change_role_button = QPushButton('Change Role')
+                self.change_role_button.setObjectName('adminButton')
                 self.change_role_button.clicked.connect(self.change_selected_user_role)
-            
-            # Style admin buttons
-            button_style = """
-                QPushButton {
-                    background-color: #3498db;
-                    color: white;
-                    padding: 8px 12px;
-                    font-size: 10px;
-                    border: none;
-                    border-radius: 3px;
-                    margin: 2px;
-                }
-                QPushButton:hover {
-                    background-color: #2980b9;
-                }
-            """
-            
+
             admin_controls_layout.addWidget(QLabel("Admin Controls:"))
-            
-            if hasattr(self, 'toggle_status_button'):
-                self.toggle_status_button.setStyleSheet(button_style)
+
+            if self.toggle_status_button is not None:
                 admin_controls_layout.addWidget(self.toggle_status_button)
-            
-            if hasattr(self, 'change_role_button'):
-                self.change_role_button.setStyleSheet(button_style)
+
+            if self.change_role_button is not None:
                 admin_controls_layout.addWidget(self.change_role_button)
-            
+
             admin_controls_layout.addStretch()
-        
+
         # Layout
         layout.addLayout(header_layout)
         layout.addWidget(info_label)
@@ -132,15 +202,15 @@ Status: {'Active' if self.current_user.is_active else 'Inactive'}""")
         layout.addLayout(filter_layout)
         layout.addWidget(table_label)
         layout.addWidget(self.users_table)
-        if self.should_show_admin_controls():
+        if show_admin:
             layout.addLayout(admin_controls_layout)
-        
+
         self.setLayout(layout)
-    
+
     def should_show_admin_controls(self):
         """Determine if admin controls should be shown based on user role"""
-        return self.current_user.role in [UserRole.ADMIN, UserRole.FACULTY]
-    
+        return self._is_privileged
+
     def load_filter_roles(self):
         """Load available filter roles based on user permissions"""
         result = self.user_service.get_available_filter_roles()
@@ -151,129 +221,124 @@ Status: {'Active' if self.current_user.is_active else 'Inactive'}""")
         else:
             # Fallback to basic roles if API fails
             self.role_filter.addItem("All Roles", "")
-    
+
     def setup_users_table(self):
         """Setup the users table with proper headers and styling"""
-        self.users_table.setColumnCount(5)
-        self.users_table.setHorizontalHeaderLabels(['ID', 'Username', 'Email', 'Role', 'Status'])
         self.users_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.users_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-        
-        # Make table columns resize properly
+
+        # Fixed default column widths instead of ResizeToContents, which
+        # would force Qt to measure every row's content on each refresh
         header = self.users_table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
-    
-    def load_users_table(self):
-        """Load users into the table based on role filter"""
+        header.setDefaultSectionSize(120)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+
+    def apply_role_filter(self):
+        """Filter the visible rows by the selected role via the proxy"""
         selected_role = self.role_filter.currentData()
-        
+        # The role column displays title-cased labels; no label is a
+        # substring of another, so a fixed-string match is exact enough
+        self.users_proxy.setFilterFixedString(selected_role.title() if selected_role else "")
+
+    def load_users_table(self):
+        """Load users into the table (filtering is handled by the proxy)"""
         # Get all users (already filtered by backend based on user role)
         result = self.user_service.get_all_users()
-        if not result.get('success'):
-            users = []
-        else:
-            all_users = result.get('users', [])
-            # Apply frontend filter if a specific role is selected
-            if selected_role:
-                users = [user for user in all_users if user.role.value == selected_role]
-            else:
-                users = all_users
-        
-        self.users_table.setRowCount(len(users))
-        
-        for row, user in enumerate(users):
-            self.users_table.setItem(row, 0, QTableWidgetItem(str(user.id)))
-            self.users_table.setItem(row, 1, QTableWidgetItem(user.username))
-            self.users_table.setItem(row, 2, QTableWidgetItem(user.email))
-            self.users_table.setItem(row, 3, QTableWidgetItem(user.role.value.title()))
-            
-            # Enhanced status display
-            status_text = 'Active' if user.is_active else 'Inactive'
-            if user.id == self.current_user.id:
-                status_text += ' (You)'
-            
-            status_item = QTableWidgetItem(status_text)
-            if user.is_active:
-                status_item.setBackground(Qt.GlobalColor.lightGray)
-            else:
-                status_item.setBackground(Qt.GlobalColor.yellow)
-            self.users_table.setItem(row, 4, status_item)
-    
+        users = result.get('users', []) if result.get('success') else []
+
+        # Suppress view repaints and selection-change signals while the
+        # model resets, then repaint the viewport once at the end
+        self.users_table.setUpdatesEnabled(False)
+        self.users_table.blockSignals(True)
+        try:
+            self.users_model.set_users(users, self.current_user.id)
+        finally:
+            self.users_table.blockSignals(False)
+            self.users_table.setUpdatesEnabled(True)
+            self.users_table.viewport().update()
+
+    def get_selected_user(self):
+        """Get the User object for the currently selected row"""
+        index = self.users_table.currentIndex()
+        if index.isValid():
+            source_index = self.users_proxy.mapToSource(index)
+            return self.users_model.user_at(source_index.row())
+        return None
+
     def get_selected_user_id(self):
         """Get the ID of the currently selected user"""
-        current_row = self.users_table.currentRow()
-        if current_row >= 0:
-            id_item = self.users_table.item(current_row, 0)
-            if id_item:
-                return int(id_item.text())
+        user = self.get_selected_user()
+        if user is not None:
+            return user.id
         return None
-    
+
     def toggle_selected_user_status(self):
         """Toggle the active status of the selected user"""
-        user_id = self.get_selected_user_id()
-        if user_id is None:
+        selected_user = self.get_selected_user()
+        if selected_user is None:
             QMessageBox.warning(self, "Warning", "Please select a user first")
             return
-        
+
         # Check if trying to modify own account
-        if user_id == self.current_user.id:
+        if selected_user.id == self.current_user.id:
             QMessageBox.warning(self, "Warning", "You cannot change your own status")
             return
-        
+
         # Additional check for faculty role
         if self.current_user.role == UserRole.FACULTY:
-            # Get selected user's role from table
-            current_row = self.users_table.currentRow()
-            if current_row >= 0:
-                role_item = self.users_table.item(current_row, 3)
-                if role_item and role_item.text().lower() != 'student':
-                    QMessageBox.warning(self, "Warning", "Faculty can only toggle student status")
-                    return
-        
-        result = self.user_service.toggle_user_status(user_id)
+            if selected_user.role != UserRole.STUDENT:
+                QMessageBox.warning(self, "Warning", "Faculty can only toggle student status")
+                return
+
+        result = self.user_service.toggle_user_status(selected_user.id)
         if result['success']:
             QMessageBox.information(self, "Success", result['message'])
             self.load_users_table()
         else:
             QMessageBox.critical(self, "Error", result['error'])
-    
-    def change_selected_user_role(self):
-        """Change the role of the selected user"""
-        user_id = self.get_selected_user_id()
-        if user_id is None:
-            QMessageBox.warning(self, "Warning", "Please select a user first")
-            return
-        
-        # Check if trying to modify own account
-        if user_id == self.current_user.id:
-            QMessageBox.warning(self, "Warning", "You cannot change your own role")
-            return
-        
-        # Create a dialog to select new role
+
+    def _build_role_dialog(self):
+        """Build the reusable role-selection dialog"""
         dialog = QDialog(self)
         dialog.setWindowTitle("Change User Role")
         dialog.setFixedSize(300, 150)
-        
+
         layout = QVBoxLayout()
-        
+
         role_label = QLabel("Select new role:")
         role_combo = QComboBox()
-        role_combo.addItem("Student", UserRole.STUDENT)
-        role_combo.addItem("Faculty", UserRole.FACULTY)
-        role_combo.addItem("Staff", UserRole.STAFF)
-        role_combo.addItem("Admin", UserRole.ADMIN)
-        
+        populate_role_combo(role_combo)
+
         buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
         buttons.accepted.connect(dialog.accept)
         buttons.rejected.connect(dialog.reject)
-        
+
         layout.addWidget(role_label)
         layout.addWidget(role_combo)
         layout.addWidget(buttons)
         dialog.setLayout(layout)
-        
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            new_role = role_combo.currentData()
+
+        self._role_dialog_combo = role_combo
+        return dialog
+
+    def change_selected_user_role(self):
+        """Change the role of the selected user"""
+        user_id = self.get_selected_user_id()
+        if user_id is None:
+            QMessageBox.warning(self, "Warning", "Please select a user first")
+            return
+
+        # Check if trying to modify own account
+        if user_id == self.current_user.id:
+            QMessageBox.warning(self, "Warning", "You cannot change your own role")
+            return
+
+        # Build the role-selection dialog once and reuse it on later opens
+        if self._role_dialog is None:
+            self._role_dialog = self._build_role_dialog()
+
+        if self._role_dialog.exec() == QDialog.DialogCode.Accepted:
+            new_role = self._role_dialog_combo.currentData()
             result = self.user_service.change_user_role(user_id, new_role.value)
             if result['success']:
                 QMessageBox.information(self, "Success", result['message'])
@@ -1,5 +1,32 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QMessageBox
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool
+from utils.validators import ValidationUtils
+
+
+class LoginWorkerSignals(QObject):
+    """Signals emitted by LoginWorker (QRunnable cannot own signals itself)"""
+    finished = pyqtSignal(dict)  # Login result dict from UserService.login
+    failed = pyqtSignal(str)     # Unexpected exception message
+
+
+class LoginWorker(QRunnable):
+    """Runs the blocking UserService.login call on a worker thread"""
+
+    def __init__(self, user_service, email, password):
+        super().__init__()
+        self.user_service = user_service
+        self.email = email
+        self.password = password
+        self.signals = LoginWorkerSignals()
+
+    def run(self):
+        try:
+            result = self.user_service.login(self.email, self.password)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
 
 class LoginWindow(QWidget):
     login_success = pyqtSignal(object)  # Signal to emit when login is successful
@@ -19,57 +46,24 @@ class LoginWindow(QWidget):
         # Title
         title_label = QLabel('Login to Your Account')
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("""
-            QLabel {
-                font-size: 18px;
-                font-weight: bold;
-                padding: 20px;
-                color: #2c3e50;
-            }
-        """)
+        title_label.setObjectName('titleLabel')
         
         # Input fields
         self.email_input = QLineEdit()
         self.email_input.setPlaceholderText('Email')
-        self.email_input.setStyleSheet("padding: 8px; font-size: 12px;")
         
         self.password_input = QLineEdit()
         self.password_input.setPlaceholderText('Password')
         self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        self.password_input.setStyleSheet("padding: 8px; font-size: 12px;")
         
         # Buttons
         button_layout = QHBoxLayout()
         
         self.login_button = QPushButton('Login')
-        self.login_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                padding: 10px;
-                font-size: 12px;
-                border: none;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
+        self.login_button.setObjectName('primaryButton')
         
         self.register_button = QPushButton('Register')
-        self.register_button.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-                padding: 10px;
-                font-size: 12px;
-                border: none;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #7f8c8d;
-            }
-        """)
+        self.register_button.setObjectName('secondaryButton')
         
         # Connect signals
         self.login_button.clicked.connect(self.handle_login)
@@ -97,53 +91,65 @@ class LoginWindow(QWidget):
             QMessageBox.warning(self, "Input Error", "Please fill in all fields")
             return
         
-        # Basic email validation
-        if '@' not in email or '.' not in email.split('@')[-1]:
-            QMessageBox.warning(self, "Input Error", "Please enter a valid email address")
+        # Validate email format before firing the network request
+        valid, error = ValidationUtils.validate_email(email)
+        if not valid:
+            QMessageBox.warning(self, "Input Error", error)
             return
         
         # Disable login button to prevent multiple clicks
         self.login_button.setEnabled(False)
         self.login_button.setText("Logging in...")
-        
-        try:
-            result = self.user_service.login(email, password)
-            
-            if result['success']:
-                self.login_success.emit(result['user'])
-                self.close()
-            else:
-                # Handle different error types
-                error_msg = result.get('error', 'Login failed')
-                if isinstance(error_msg, dict):
-                    error_msg = error_msg.get('detail', 'Login failed')
-                
-                # Provide user-friendly error messages
-                if 'Invalid credentials' in str(error_msg).lower():
-                    error_msg = "Invalid email or password. Please check your credentials and try again."
-                elif 'connection' in str(error_msg).lower():
-                    error_msg = "Unable to connect to server. Please check your internet connection and try again."
-                elif 'timeout' in str(error_msg).lower():
-                    error_msg = "Request timed out. The server may be experiencing high load. Please try again."
-                
-                QMessageBox.critical(self, "Login Failed", str(error_msg))
-                
-        except Exception as e:
-            error_message = (
-                "An unexpected error occurred while trying to log in.\n\n"
-                "Please ensure:\n"
-                "• The Django backend server is running\n"
-                "• Your internet connection is stable\n"
-                "• The server address is correct\n\n"
-                f"Technical details: {str(e)}"
-            )
-            QMessageBox.critical(self, "Connection Error", error_message)
-        
-        finally:
-            # Re-enable login button
-            self.login_button.setEnabled(True)
-            self.login_button.setText("Login")
-    
+
+        # Run the blocking API call on a worker thread so the UI keeps
+        # painting; the result comes back via a queued signal
+        self._login_worker = LoginWorker(self.user_service, email, password)
+        self._login_worker.signals.finished.connect(self.on_login_finished)
+        self._login_worker.signals.failed.connect(self.on_login_failed)
+        QThreadPool.globalInstance().start(self._login_worker)
+
+    def on_login_finished(self, result):
+        """Process the login result back on the GUI thread"""
+        self.restore_login_button()
+
+        if result['success']:
+            self.login_success.emit(result['user'])
+            self.close()
+        else:
+            # Handle different error types
+            error_msg = result.get('error', 'Login failed')
+            if isinstance(error_msg, dict):
+                error_msg = error_msg.get('detail', 'Login failed')
+
+            # Provide user-friendly error messages
+            if 'Invalid credentials' in str(error_msg).lower():
+                error_msg = "Invalid email or password. Please check your credentials and try again."
+            elif 'connection' in str(error_msg).lower():
+                error_msg = "Unable to connect to server. Please check your internet connection and try again."
+            elif 'timeout' in str(error_msg).lower():
+                error_msg = "Request timed out. The server may be experiencing high load. Please try again."
+
+            QMessageBox.critical(self, "Login Failed", str(error_msg))
+
+    def on_login_failed(self, details):
+        """Handle an unexpected error raised by the login worker"""
+        self.restore_login_button()
+
+        error_message = (
+            "An unexpected error occurred while trying to log in.\n\n"
+            "Please ensure:\n"
+            "• The Django backend server is running\n"
+            "• Your internet connection is stable\n"
+            "• The server address is correct\n\n"
+            f"Technical details: {details}"
+        )
+        QMessageBox.critical(self, "Connection Error", error_message)
+
+    def restore_login_button(self):
+        """Re-enable the login button after a login attempt completes"""
+        self.login_button.setEnabled(True)
+        self.login_button.setText("Login")
+
     def clear_inputs(self):
         self.email_input.clear()
         self.password_input.clear()
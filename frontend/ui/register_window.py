@@ -1,7 +1,7 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QMessageBox, QComboBox
 from PyQt6.QtCore import Qt, pyqtSignal
-from models.user import UserRole
-import re
+from ui.widgets import populate_role_combo
+from utils.validators import ValidationUtils
 
 class RegisterWindow(QWidget):
     registration_success = pyqtSignal()  # Signal to emit when registration is successful
@@ -21,77 +21,39 @@ class RegisterWindow(QWidget):
         # Title
         title_label = QLabel('Create New Account')
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("""
-            QLabel {
-                font-size: 18px;
-                font-weight: bold;
-                padding: 20px;
-                color: #2c3e50;
-            }
-        """)
+        title_label.setObjectName('titleLabel')
         
         # Input fields
         self.username_input = QLineEdit()
         self.username_input.setPlaceholderText('Username')
-        self.username_input.setStyleSheet("padding: 8px; font-size: 12px;")
         
         self.email_input = QLineEdit()
         self.email_input.setPlaceholderText('Email')
-        self.email_input.setStyleSheet("padding: 8px; font-size: 12px;")
         
         # Role selection
         role_label = QLabel('Select Role:')
-        role_label.setStyleSheet("font-weight: bold; color: #2c3e50;")
+        role_label.setObjectName('fieldLabel')
         
         self.role_combo = QComboBox()
-        self.role_combo.addItem("Student", UserRole.STUDENT)
-        self.role_combo.addItem("Faculty", UserRole.FACULTY)
-        self.role_combo.addItem("Staff", UserRole.STAFF)
-        self.role_combo.addItem("Admin", UserRole.ADMIN)
-        self.role_combo.setStyleSheet("padding: 8px; font-size: 12px;")
+        populate_role_combo(self.role_combo)
+        self.role_combo.setObjectName('roleCombo')
         
         self.password_input = QLineEdit()
         self.password_input.setPlaceholderText('Password')
         self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        self.password_input.setStyleSheet("padding: 8px; font-size: 12px;")
         
         self.confirm_password_input = QLineEdit()
         self.confirm_password_input.setPlaceholderText('Confirm Password')
         self.confirm_password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        self.confirm_password_input.setStyleSheet("padding: 8px; font-size: 12px;")
         
         # Buttons
         button_layout = QHBoxLayout()
         
         self.register_button = QPushButton('Register')
-        self.register_button.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                padding: 10px;
-                font-size: 12px;
-                border: none;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-        """)
+        self.register_button.setObjectName('successButton')
         
         self.back_button = QPushButton('Back to Login')
-        self.back_button.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-                padding: 10px;
-                font-size: 12px;
-                border: none;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #7f8c8d;
-            }
-        """)
+        self.back_button.setObjectName('secondaryButton')
         
         # Connect signals
         self.register_button.clicked.connect(self.handle_register)
@@ -123,15 +85,21 @@ class RegisterWindow(QWidget):
         if not all([username, email, password, confirm_password]):
             QMessageBox.warning(self, "Error", "Please fill in all fields")
             return
-        
+
         if password != confirm_password:
             QMessageBox.warning(self, "Error", "Passwords do not match")
             return
-        
-        if len(password) < 6:
-            QMessageBox.warning(self, "Error", "Password must be at least 6 characters")
+
+        valid, error = ValidationUtils.validate_username(username)
+        if not valid:
+            QMessageBox.warning(self, "Error", error)
             return
-        
+
+        valid, error = ValidationUtils.validate_password(password)
+        if not valid:
+            QMessageBox.warning(self, "Error", error)
+            return
+
         if not self.is_valid_email(email):
             QMessageBox.warning(self, "Error", "Please enter a valid email address")
             return
@@ -159,8 +127,7 @@ class RegisterWindow(QWidget):
             QMessageBox.critical(self, "Registration Failed", error_message)
     
     def is_valid_email(self, email):
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return ValidationUtils.validate_email(email)[0]
     
     def clear_inputs(self):
         self.username_input.clear()
@@ -0,0 +1,103 @@
+"""
+Application-wide Qt stylesheet.
+
+All per-widget setStyleSheet() blocks from the login, register, and
+dashboard windows are consolidated here and applied once on the
+QApplication at startup, so Qt parses the QSS a single time instead of
+once per widget. Widgets opt in via setObjectName().
+"""
+
+QSS = """
+    QLabel#titleLabel {
+        font-size: 18px;
+        font-weight: bold;
+        padding: 20px;
+        color: #2c3e50;
+    }
+    QLabel#welcomeLabel {
+        font-size: 16px;
+        font-weight: bold;
+        color: #2c3e50;
+        padding: 10px;
+    }
+    QLabel#sectionLabel {
+        font-size: 14px;
+        font-weight: bold;
+        padding: 10px;
+    }
+    QLabel#fieldLabel {
+        font-weight: bold;
+        color: #2c3e50;
+    }
+    QLabel#userDetails {
+        padding: 10px;
+        background-color: #808080;
+        border-radius: 5px;
+    }
+
+    QLineEdit {
+        padding: 8px;
+        font-size: 12px;
+    }
+    QComboBox#roleCombo {
+        padding: 8px;
+        font-size: 12px;
+    }
+
+    QPushButton#primaryButton {
+        background-color: #3498db;
+        color: white;
+        padding: 10px;
+        font-size: 12px;
+        border: none;
+        border-radius: 5px;
+    }
+    QPushButton#primaryButton:hover {
+        background-color: #2980b9;
+    }
+    QPushButton#successButton {
+        background-color: #27ae60;
+        color: white;
+        padding: 10px;
+        font-size: 12px;
+        border: none;
+        border-radius: 5px;
+    }
+    QPushButton#successButton:hover {
+        background-color: #229954;
+    }
+    QPushButton#secondaryButton {
+        background-color: #95a5a6;
+        color: white;
+        padding: 10px;
+        font-size: 12px;
+        border: none;
+        border-radius: 5px;
+    }
+    QPushButton#secondaryButton:hover {
+        background-color: #7f8c8d;
+    }
+    QPushButton#dangerButton {
+        background-color: #e74c3c;
+        color: white;
+        padding: 8px 16px;
+        font-size: 12px;
+        border: none;
+        border-radius: 5px;
+    }
+    QPushButton#dangerButton:hover {
+        background-color: #c0392b;
+    }
+    QPushButton#adminButton {
+        background-color: #3498db;
+        color: white;
+        padding: 8px 12px;
+        font-size: 10px;
+        border: none;
+        border-radius: 3px;
+        margin: 2px;
+    }
+    QPushButton#adminButton:hover {
+        background-color: #2980b9;
+    }
+"""
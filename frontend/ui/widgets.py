@@ -0,0 +1,13 @@
+"""
+Shared widget helpers for the frontend UI.
+"""
+from models.user import UserRole, ROLE_LABEL
+
+# Student first so it stays the default selection in registration forms
+_ROLE_COMBO_ORDER = (UserRole.STUDENT, UserRole.FACULTY, UserRole.STAFF, UserRole.ADMIN)
+
+
+def populate_role_combo(combo):
+    """Fill a QComboBox with every user role, labelled for display"""
+    for role in _ROLE_COMBO_ORDER:
+        combo.addItem(ROLE_LABEL[role], role)
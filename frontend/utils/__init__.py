@@ -0,0 +1,3 @@
+from .validators import ValidationUtils
+
+__all__ = ['ValidationUtils']
@@ -0,0 +1,18 @@
+"""
+Shared compiled regex patterns for frontend validation.
+
+compile_pattern() memoizes compilation so every call site shares exactly
+one re.Pattern object per pattern string, instead of each module keeping
+its own copy of the same regex.
+"""
+import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a regex once and hand back the same Pattern on every call"""
+    return re.compile(pattern)
+
+
+USERNAME_RE = compile_pattern(r'^[a-zA-Z0-9_]+$')
@@ -0,0 +1,53 @@
+"""
+Local session cache for the frontend application.
+
+Stores the authentication token from the last successful login so the
+application can restore the session on relaunch without asking for
+credentials or paying the login round trip again. Only the API token is
+cached (never the password), in a file readable only by the owner.
+"""
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Dict
+
+logger = logging.getLogger(__name__)
+
+SESSION_CACHE_FILE = Path.home() / '.django_user_mgmt_session.json'
+
+
+def save_session(email: str, token: str) -> None:
+    """Persist the session token for the given account"""
+    try:
+        # Owner-only from the first byte: a default-permission write
+        # followed by chmod would briefly leave the token world-readable
+        fd = os.open(
+            SESSION_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+        )
+        with os.fdopen(fd, 'w') as f:
+            f.write(json.dumps({'email': email, 'token': token}))
+        logger.debug("Session cached for %s", email)
+    except OSError as e:
+        logger.warning("Could not cache session: %s", e)
+
+
+def load_session() -> Optional[Dict[str, str]]:
+    """Load the cached session, or None if absent or unreadable"""
+    try:
+        data = json.loads(SESSION_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if isinstance(data, dict) and data.get('token'):
+        return data
+    return None
+
+
+def clear_session() -> None:
+    """Remove the cached session (called on logout)"""
+    try:
+        SESSION_CACHE_FILE.unlink(missing_ok=True)
+        logger.debug("Session cache cleared")
+    except OSError as e:
+        logger.warning("Could not clear session cache: %s", e)
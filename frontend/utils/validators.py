@@ -1,17 +1,33 @@
-import re
+from string import ascii_letters, digits
 from typing import Tuple
 
+from .patterns import USERNAME_RE
+
+# Character sets accepted in each part of an email address. Checked with a
+# linear scan instead of a regex: the previous pattern's adjacent character
+# classes could backtrack superlinearly on long non-matching input.
+_EMAIL_LOCAL_CHARS = frozenset(ascii_letters + digits + '._%+-')
+_EMAIL_DOMAIN_CHARS = frozenset(ascii_letters + digits + '.-')
+
 class ValidationUtils:
     @staticmethod
     def validate_email(email: str) -> Tuple[bool, str]:
         """Validate email format"""
         if not email:
             return False, "Email is required"
-        
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, email):
+
+        local, sep, domain = email.partition('@')
+        dot = domain.rfind('.')
+        tld = domain[dot + 1:]
+        if (not sep
+                or not local
+                or dot < 1  # Domain needs at least one char before the dot
+                or len(tld) < 2
+                or not (tld.isascii() and tld.isalpha())
+                or not all(c in _EMAIL_LOCAL_CHARS for c in local)
+                or not all(c in _EMAIL_DOMAIN_CHARS for c in domain)):
             return False, "Invalid email format"
-        
+
         return True, ""
     
     @staticmethod
@@ -26,7 +42,7 @@ class ValidationUtils:
         if len(username) > 20:
             return False, "Username must be less than 20 characters"
         
-        if not re.match(r'^[a-zA-Z0-9_]+$', username):
+        if not USERNAME_RE.match(username):
             return False, "Username can only contain letters, numbers, and underscores"
         
         return True, ""
@@ -0,0 +1,36 @@
+"""
+Shared Django bootstrap for the testing scripts.
+
+Importing this module puts the backend package on sys.path, points
+DJANGO_SETTINGS_MODULE at the project settings (unless the caller
+already selected different settings), and runs django.setup(). Python's
+module cache guarantees the work happens once per process even when
+several scripts import it in the same interpreter.
+"""
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BACKEND_DIR = PROJECT_ROOT / 'backend'
+
+_DONE = False
+
+
+def setup():
+    """Configure sys.path and Django once per process"""
+    global _DONE
+    if _DONE:
+        return
+
+    if str(BACKEND_DIR) not in sys.path:
+        sys.path.insert(0, str(BACKEND_DIR))
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+    import django
+    django.setup()
+    _DONE = True
+
+
+setup()
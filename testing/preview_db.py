@@ -6,62 +6,70 @@ This script shows what data exists in the database without deleting anything.
 Use this to preview data before running wipe_all.py
 """
 
-import os
 import sys
-import django
-
-import sys
-import os
 from pathlib import Path
 
-# Add the backend directory to Python path (absolute path, robust)
-project_root = Path(__file__).resolve().parent.parent
-backend_dir = project_root / 'backend'
-if str(backend_dir) not in sys.path:
-    sys.path.insert(0, str(backend_dir))
-
-# Setup Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-django.setup()
+import _bootstrap  # noqa: F401  (sys.path + Django setup, once per process)
 
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from rest_framework.authtoken.models import Token
 
 User = get_user_model()
 
+@transaction.atomic
 def preview_database():
     """Preview all data in the database"""
     print("📊 Database Content Preview")
     print("=" * 50)
-    
-    # Count data
-    user_count = User.objects.count()
-    token_count = Token.objects.count()
-    
+
+    # Cheap .exists() presence checks first; only run the aggregate
+    # counts when there are rows to count
+    has_users = User.objects.exists()
+    has_tokens = Token.objects.exists()
+    user_count = User.objects.count() if has_users else 0
+    token_count = Token.objects.count() if has_tokens else 0
+
     print(f"📈 Summary:")
     print(f"   - Total Users: {user_count}")
     print(f"   - Total Tokens: {token_count}")
     print()
-    
-    if user_count == 0:
+
+    if not has_users:
         print("📭 No users found in database")
     else:
         print("👥 Users in database:")
         print("-" * 30)
-        for user in User.objects.all():
+        # Stream rows in chunks and load only the displayed columns
+        # instead of materializing full model instances for every user
+        users = User.objects.only(
+            'id', 'username', 'email', 'role', 'is_active', 'is_superuser'
+        ).order_by('id')
+        # Buffer the rows and write them in one go rather than flushing
+        # line-buffered stdout once per user
+        lines = []
+        for user in users.iterator(chunk_size=1000):
             active_status = "✅ Active" if user.is_active else "❌ Inactive"
             superuser_status = "👑 Superuser" if user.is_superuser else ""
-            print(f"   ID: {user.id:<3} | {user.username:<15} | {user.email:<25} | {user.role:<8} | {active_status} {superuser_status}")
+            lines.append(f"   ID: {user.id:<3} | {user.username:<15} | {user.email:<25} | {user.role:<8} | {active_status} {superuser_status}")
+        sys.stdout.write('\n'.join(lines))
+        sys.stdout.write('\n')
     
     print()
     
-    if token_count == 0:
+    if not has_tokens:
         print("🔑 No authentication tokens found")
     else:
         print("🔑 Authentication tokens:")
         print("-" * 30)
-        for token in Token.objects.all():
-            print(f"   User: {token.user.username:<15} | Token: {str(token.key)[:20]}...")
+        # select_related joins the user in the same query instead of one
+        # extra SELECT per token; .only() narrows to the displayed columns
+        tokens = Token.objects.select_related('user').only('key', 'user__username')
+        lines = []
+        for token in tokens.iterator(chunk_size=500):
+            lines.append(f"   User: {token.user.username:<15} | Token: {str(token.key)[:20]}...")
+        sys.stdout.write('\n'.join(lines))
+        sys.stdout.write('\n')
     
     print()
     print("💡 Tips:")
@@ -75,20 +75,26 @@ def test_environment_loading():
     """Test environment variable loading"""
     print("\n🔐 Testing Environment Variables...")
     try:
+        # One scandir per directory instead of a stat syscall per probe;
+        # the cached entry sets answer any number of existence checks
+        def dir_entries(path):
+            try:
+                return {entry.name for entry in os.scandir(path)}
+            except OSError:
+                return set()
+
         # Check backend environment
-        backend_env_path = os.path.join(os.path.dirname(__file__), 'backend', '.env')
-        if os.path.exists(backend_env_path):
+        if '.env' in dir_entries(project_root / 'backend'):
             print("✅ Backend .env file exists")
         else:
             print("⚠️  Backend .env file not found (using defaults)")
-        
+
         # Check frontend environment
-        frontend_env_path = os.path.join(os.path.dirname(__file__), 'frontend', '.env')
-        if os.path.exists(frontend_env_path):
+        if '.env' in dir_entries(project_root / 'frontend'):
             print("✅ Frontend .env file exists")
         else:
             print("⚠️  Frontend .env file not found (using defaults)")
-        
+
         return True
     except Exception as e:
         print(f"❌ Environment test failed: {e}")